@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+# Small http server for forwarding FritzBox dyndns updates to several dyndns providers
+# Built using FastAPI
+# Runs uvicorn webserver
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import queue
+import secrets
+import socket
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from ipaddress import (
+    AddressValueError,
+    IPv4Address,
+    IPv6Address,
+    IPv6Network,
+    NetmaskValueError,
+)
+from typing import Annotated
+
+import aiohttp
+import uvicorn
+from anyio import to_thread
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+
+from dyndnsutil import (
+    DynDNSTarget,
+    INWXDynDNSTarget,
+    IonosDynDNSTarget,
+    NamecheapDynDNSTarget,
+)
+
+### EDIT THE FOLLOWING SECTION
+
+# Read provider specific stuff from env
+# e.g.
+# DYNDNS_IONOS_Q_1 = os.getenv("DYNDNS_IONOS_Q_1", "")
+
+# Append your dyndns targets to this list
+dyndns_targets: list[DynDNSTarget] = []
+# dyndns_targets.append(IonosDynDNSTarget(DYNDNS_IONOS_Q_1, "name", IPv6Address("::dead:beef")))
+
+### DON'T EDIT BELOW
+
+# Read general settings from env
+LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
+ACCESS_LOG = False if os.getenv("ACCESS_LOG", "").lower() in ["false", "0"] else True
+BIND = os.getenv("BIND", "127.0.0.1")
+PORT = int(os.getenv("PORT", "8000"))
+PASS_SHA256 = os.getenv(
+    "PASS_SHA256",
+    hashlib.sha256("password".encode("utf8")).hexdigest(),
+)
+# Outbound connection pool limits (the aiohttp defaults cap fan-out at 100 total)
+AIOHTTP_LIMIT = int(os.getenv("AIOHTTP_LIMIT", "100"))
+AIOHTTP_LIMIT_PER_HOST = int(os.getenv("AIOHTTP_LIMIT_PER_HOST", "20"))
+
+# Bound every update request, because after the daily IP reconnect
+# the connection to a provider might hang for a while
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+
+# Number of background workers performing the actual update requests
+UPDATE_WORKERS = int(os.getenv("UPDATE_WORKERS", "4"))
+
+# Size of the thread pool Starlette runs sync dependencies on (AnyIO default: 40)
+THREADPOOL = int(os.getenv("THREADPOOL", "200"))
+
+# Number of uvicorn worker processes
+# ! With more than one worker, every process keeps its own last-ip state,
+# ! so providers may receive a few duplicate updates after an IP change
+WORKERS = int(os.getenv("WORKERS", "1"))
+
+# Background worker performing the actual update requests,
+# so http responses don't have to wait on the slowest provider
+async def _update_worker(queue: asyncio.Queue, session: aiohttp.ClientSession):
+    global _last_inputs
+    while True:
+        target: DynDNSTarget = await queue.get()
+        try:
+            if await target.do_update(session):
+                logger.info("%s update request was successfull", target.name)
+            else:
+                # Since all http status codes >= 400 raise an exception (ClientSession(raise_for_status=True))
+                # and redirects are followed / raise TooManyRedirects this should only be reached
+                # if one of the providers implements some cursed response logic
+                # (e.g. sending HTTP 200 but putting "error" in the body or something)
+                logger.warning("%s update request failed", target.name)
+                _last_inputs = None
+        except aiohttp.ClientResponseError as e:
+            logger.warning(
+                "%s update request returned http status code %s", target.name, e.status
+            )
+            _last_inputs = None
+        except Exception as e:
+            logger.warning("%s update request raised an exception: %r", target.name, e)
+            _last_inputs = None
+        finally:
+            queue.task_done()
+
+
+# One pooled client session for the whole app lifetime,
+# so outbound connections (and their TLS handshakes) get reused between updates;
+# also spawns the background update workers
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Route log records through a queue so the actual stderr write happens on
+    # the listener thread instead of blocking the event loop.
+    # Attached here and not at import time: when run as a script, uvicorn
+    # imports this module a second time to resolve "dyndns_update_server:app",
+    # and module-level addHandler would leave the logger with a stale second
+    # QueueHandler whose queue is never drained
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_handler = QueueHandler(log_queue)
+    logger.addHandler(log_handler)
+    log_listener = QueueListener(log_queue, lh)
+    log_listener.start()
+
+    # Sync dependencies (like HTTPBasic) run on AnyIO's thread pool;
+    # raise its token count so concurrent requests don't queue behind it
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL
+
+    app.state.http = aiohttp.ClientSession(
+        raise_for_status=True,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=_HTTP_TIMEOUT,
+        connector=aiohttp.TCPConnector(
+            limit=AIOHTTP_LIMIT,
+            limit_per_host=AIOHTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+        ),
+    )
+    app.state.update_queue = asyncio.Queue()
+    workers = [
+        asyncio.create_task(_update_worker(app.state.update_queue, app.state.http))
+        for _ in range(UPDATE_WORKERS)
+    ]
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await app.state.http.close()
+        logger.removeHandler(log_handler)
+        log_listener.stop()
+
+
+app = FastAPI(
+    debug=False, openapi_url=None, docs_url=None, redoc_url=None, lifespan=lifespan
+)
+
+logger = logging.getLogger("DynDNS Updater Server")
+logger.setLevel(logging.getLevelNamesMapping()[LOG_LEVEL.upper()])
+lh = logging.StreamHandler()
+lh.setFormatter(logging.Formatter("%(levelname)-8s %(message)s"))
+# lh is not attached directly; the lifespan handler feeds it via a QueueListener
+
+# The ips of the last fully successful update request;
+# used to skip repeat requests with unchanged addresses entirely
+_last_inputs: tuple | None = None
+
+# Just simple HTTP basic auth
+# Server is most likely deployed locally without tls anyway,
+# so we're just trying to prevent the most basic of abuse
+security = HTTPBasic()
+
+
+# The FritzBox sends the same credentials on every request,
+# so cache the digest instead of rehashing each time
+# (the actual comparison below stays constant-time via secrets.compare_digest)
+@functools.lru_cache(maxsize=64)
+def _pw_hash(pw: bytes) -> str:
+    return hashlib.sha256(pw).hexdigest()
+
+
+# Cached ip parsers: repeat requests nearly always carry the exact same strings,
+# so this turns three ip parses into dict lookups.
+# On a cache miss the strings are parsed with socket.inet_pton (a thin libc
+# wrapper) and the ipaddress objects are built from the packed bytes, which
+# skips the pure-Python string validation in the ipaddress constructors.
+# Invalid/empty values map to None (see comment in dyndns() about the FritzBox)
+@functools.lru_cache(maxsize=8)
+def _parse_v4(s: str) -> IPv4Address | None:
+    try:
+        return IPv4Address(socket.inet_pton(socket.AF_INET, s))
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_v6(s: str) -> IPv6Address | None:
+    try:
+        return IPv6Address(socket.inet_pton(socket.AF_INET6, s))
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_v6net(s: str) -> IPv6Network | None:
+    # Reject garbage with inet_pton before handing the mask logic to IPv6Network
+    try:
+        socket.inet_pton(socket.AF_INET6, s.partition("/")[0])
+    except OSError:
+        return None
+    try:
+        return IPv6Network(s, strict=False)
+    except (AddressValueError, NetmaskValueError):
+        return None
+
+
+# response_class=Response / response_model=None skip FastAPI's per-request
+# response validation and serialization; we only ever return bare status codes
+@app.get("/dyndns", response_class=Response, response_model=None)
+async def dyndns(
+    request: Request,
+    credentials: Annotated[HTTPBasicCredentials, Depends(security)],
+    ipv4: str,
+    ipv6: str,
+    ipv6prefix: str,
+):
+    if not secrets.compare_digest(
+        _pw_hash(credentials.password.encode("utf8")), PASS_SHA256
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Basic"},
+        )
+    # Parameters are mandatory, but might be empty
+    # Because we might not be able to change how the requester builds requests (FritzBox ...), lets ignore wrong/empty values
+    ipv4 = _parse_v4(ipv4)
+    ipv6 = _parse_v6(ipv6)
+    ipv6prefix = _parse_v6net(ipv6prefix)
+
+    if ipv4 is None and ipv6 is None and ipv6prefix is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="One of ipv4, ipv6 or ipv6prefix has to be set and be valid",
+        )
+
+    # %-style args so the ipaddress objects are only stringified when INFO is enabled
+    logger.info(
+        "Received dyndns update request from %s: IPv4=%s IPv6=%s IPv6-Prefix=%s",
+        credentials.username,
+        ipv4,
+        ipv6,
+        ipv6prefix,
+    )
+
+    # The FritzBox (usually) sends two update requests: One without ipv6 and one with (Yes, it's stupid. I know).
+    # For now lets ignore the one without ipv6 to avoid sending multiple requests for the FritzBox domain name
+    # ! Keep an eye on this and remove it if it causes missed updates. Who knows how the FritzBox logic might be changed ...
+    if ipv4 is not None and ipv6 is None and ipv6prefix is not None:
+        logger.info(
+            "No ipv6 but everything else, is the FritzBox being stupid again? Ignoring this request."
+        )
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # The FritzBox also re-sends updates on a timer even when nothing changed;
+    # if every target was updated successfully with these exact ips already, skip everything
+    global _last_inputs
+    if (ipv4, ipv6, ipv6prefix) == _last_inputs:
+        logger.info("IPs unchanged since last successful update, skipping")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # Update targets ips and collect the ones that actually need an update
+    # (update_ips returns None, so the or just sequences the two calls)
+    updated_targets: list[DynDNSTarget] = [
+        target
+        for target in dyndns_targets
+        if target.update_ips(ipv4, ipv6, ipv6prefix) or target.needs_update
+    ]
+
+    # Hand the actual update requests off to the background workers;
+    # the FritzBox only cares about getting a 2xx, not about the outcome.
+    # Failed updates clear _last_inputs (and keep needs_update set),
+    # so they are retried when the FritzBox re-sends on its timer.
+    _last_inputs = (ipv4, ipv6, ipv6prefix)
+    if len(updated_targets) == 0:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    queue: asyncio.Queue = request.app.state.update_queue
+    for target in updated_targets:
+        queue.put_nowait(target)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
+
+
+# If run from command line, start webserver
+if __name__ == "__main__":
+    # Pass the app as an import string so uvicorn can spawn worker processes
+    uvicorn.run(
+        "dyndns_update_server:app",
+        host=BIND,
+        port=PORT,
+        workers=WORKERS,
+        # Explicitly request the C implementations (shipped with uvicorn[standard]),
+        # so a broken install fails loudly instead of silently falling back to asyncio + h11
+        loop="uvloop",
+        http="httptools",
+        log_level=LOG_LEVEL,
+        access_log=ACCESS_LOG,
+    )
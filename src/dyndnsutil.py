@@ -14,7 +14,10 @@ class DynDNSTarget:
         # Optional: IPv6-Suffix
         # If set, on an update it is combined with the given ipv6 prefix to create the actual new ipv6
         # If unset, the given ipv6 is used
-        self.__ipv6_suffix: IPv6Address | None = ipv6_suffix
+        # Cache the integer form once, so update_ips only has to or two ints
+        self.__ipv6_suffix_int: int | None = (
+            ipv6_suffix._ip if ipv6_suffix is not None else None
+        )
 
         self._new_ipv4: IPv4Address | None = None
         self._new_ipv6: IPv6Address | None = None
@@ -38,25 +41,30 @@ class DynDNSTarget:
     ):
         self._new_ipv4 = ipv4
 
-        if self.__ipv6_suffix is not None:
+        if self.__ipv6_suffix_int is not None:
             # Ignore ipv6 and construct ip from prefix and suffix instead
             if ipv6_prefix is not None:
-                self._new_ipv6 = ip_from_network_and_suffix(
-                    ipv6_prefix, self.__ipv6_suffix
+                self._new_ipv6 = IPv6Address(
+                    ipv6_prefix.network_address._ip | self.__ipv6_suffix_int
                 )
             else:
                 self._new_ipv6 = None
         else:
             self._new_ipv6 = ipv6
 
+    # Record the new ips as successfully pushed to the provider,
+    # so needs_update turns False until they change again
+    def _commit(self):
+        self._last_successful_ipv4 = self._new_ipv4
+        self._last_successful_ipv6 = self._new_ipv6
+
     # Do an actual update request with the new ips
     # Sets last successful ips if the request was successful
     # Must be passed a aiohttp.ClientSession to use for the request
     # Returns True if the request was successfull
     # May raise all exceptions aiohttp.ClientSession.request may raise
     async def do_update(self, session: ClientSession) -> bool:
-        self._last_successful_ipv4 = self._new_ipv4
-        self._last_successful_ipv6 = self._new_ipv6
+        self._commit()
         return True
 
 
@@ -67,10 +75,11 @@ class IonosDynDNSTarget(DynDNSTarget):
 
     def __init__(self, q: str, name: str, ipv6_suffix: IPv6Address | None = None):
         super().__init__(name, ipv6_suffix)
-        self.__q: str = q
+        # Request parameters that never change between updates
+        self.__static_params: dict[str, str] = {"q": q}
 
     async def do_update(self, session: ClientSession) -> bool:
-        params = {"q": self.__q}
+        params = dict(self.__static_params)
         if self._new_ipv4 is not None:
             params["ipv4"] = self._new_ipv4.compressed
         if self._new_ipv6 is not None:
@@ -80,9 +89,7 @@ class IonosDynDNSTarget(DynDNSTarget):
             response_ok = response.ok
 
         if response_ok:
-            # Success
-            self._last_successful_ipv4 = self._new_ipv4
-            self._last_successful_ipv6 = self._new_ipv6
+            self._commit()
 
         return response_ok
 
@@ -100,9 +107,12 @@ class NamecheapDynDNSTarget(DynDNSTarget):
         ipv6_suffix: IPv6Address | None = None,
     ):
         super().__init__(f"{host}.{domain}")
-        self.__ddns_password: str = ddns_password
-        self.__host: str = host
-        self.__domain: str = domain
+        # Request parameters that never change between updates
+        self.__static_params: dict[str, str] = {
+            "host": host,
+            "domain": domain,
+            "password": ddns_password,
+        }
 
     # Namecheap currently only supports ipv4, ignore changes to ipv6
     # ! remove this when Namecheap supports ipv6 dyndns
@@ -110,12 +120,13 @@ class NamecheapDynDNSTarget(DynDNSTarget):
     def needs_update(self):
         return self._new_ipv4 != self._last_successful_ipv4
 
+    # Only commit ipv4; an update request never pushes ipv6 to Namecheap,
+    # so recording it as successful would be a lie
+    def _commit(self):
+        self._last_successful_ipv4 = self._new_ipv4
+
     async def do_update(self, session: ClientSession) -> bool:
-        params = {
-            "host": self.__host,
-            "domain": self.__domain,
-            "password": self.__ddns_password,
-        }
+        params = dict(self.__static_params)
         if self._new_ipv4 is not None:
             params["ip"] = self._new_ipv4.compressed
 
@@ -123,9 +134,7 @@ class NamecheapDynDNSTarget(DynDNSTarget):
             response_ok = response.ok
 
         if response_ok:
-            # Success
-            self._last_successful_ipv4 = self._new_ipv4
-            self._last_successful_ipv6 = self._new_ipv6
+            self._commit()
 
         return response_ok
 
@@ -139,7 +148,8 @@ class INWXDynDNSTarget(DynDNSTarget):
         self, username: str, password: str, ipv6_suffix: IPv6Address | None = None
     ):
         super().__init__(username, ipv6_suffix)
-        self.__basic_auth: BasicAuth = BasicAuth(username, password)
+        # Encode the Authorization header once instead of per request
+        self.__auth_header: str = BasicAuth(username, password).encode()
 
     async def do_update(self, session: ClientSession) -> bool:
         params = {}
@@ -149,14 +159,12 @@ class INWXDynDNSTarget(DynDNSTarget):
             params["myipv6"] = self._new_ipv6.compressed
 
         async with session.get(
-            self.__URL, auth=self.__basic_auth, params=params
+            self.__URL, headers={"Authorization": self.__auth_header}, params=params
         ) as response:
             response_ok = response.ok
 
         if response_ok:
-            # Success
-            self._last_successful_ipv4 = self._new_ipv4
-            self._last_successful_ipv6 = self._new_ipv6
+            self._commit()
 
         return response_ok
 
@@ -171,9 +179,9 @@ def ip_from_network_and_suffix(
     if network.version != suffix.version:
         raise TypeError("Network and suffix must be of same version (v4 or v6)")
 
-    ip: int = int.from_bytes(
-        network.network_address.packed, byteorder="big", signed=False
-    ) | int.from_bytes(suffix.packed, byteorder="big", signed=False)
+    # ipaddress objects already hold their integer form in _ip;
+    # use it directly instead of round-tripping through packed bytes
+    ip: int = network.network_address._ip | suffix._ip
 
     # Make sure we return the correct version
     if network.version == 4: